@@ -8,13 +8,22 @@ import threading
 import tempfile
 import os
 import io
-from urllib.parse import urljoin
+import json
+import gzip
+import hashlib
+import random
+import html as html_lib
+import base64
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException, SessionNotCreatedException
 from webdriver_manager.chrome import ChromeDriverManager
 
 def _ensure_docx():
@@ -29,33 +38,418 @@ def _ensure_docx():
         )
         return None, None, None
 
-def _ensure_requests():
+def _ensure_reportlab():
+    try:
+        from reportlab.pdfgen import canvas
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.utils import ImageReader, simpleSplit
+        return canvas, A4, ImageReader, simpleSplit
+    except ModuleNotFoundError:
+        messagebox.showerror(
+            "Missing dependency",
+            "The package 'reportlab' is required to export PDF.\n\nInstall it with:\n\npip install reportlab"
+        )
+        return None, None, None, None
+
+def _ensure_requests(quiet=False):
     try:
         import requests
         return requests
     except ModuleNotFoundError:
+        if quiet:
+            return None
         messagebox.showerror(
             "Missing dependency",
             "The package 'requests' is required to download images for diagrams.\n\nInstall it with:\n\npip install requests"
         )
         return None
 
-def _ensure_pillow():
+def _ensure_pillow(quiet=False):
     try:
         from PIL import Image
         return Image
     except ModuleNotFoundError:
+        if quiet:
+            return None
         messagebox.showerror(
             "Missing dependency",
             "The package 'Pillow' is required to preview/convert images.\n\nInstall it with:\n\npip install pillow"
         )
         return None
 
+class TransientHTTPError(Exception):
+    pass
+
+def _save_json_atomic(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+def _app_cache_dir(*parts):
+    root = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache")
+    path = os.path.join(root, "QuestionPaperDesigner", *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def _load_json(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+class CrawlFrontier:
+
+    def __init__(self, delay=1.0, per_domain=1):
+        self.delay = delay
+        self.per_domain = per_domain
+        self._queues = {}
+        self._in_flight = {}
+        self._next_allowed = {}
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def add(self, url, depth=0):
+        with self._lock:
+            if url in self._seen:
+                return False
+            self._seen.add(url)
+            self._queues.setdefault(urlsplit(url).netloc, deque()).append((url, depth))
+            return True
+
+    def restore(self, seen, pending):
+        with self._lock:
+            self._seen.update(seen)
+            for url, depth in pending:
+                self._seen.add(url)
+                self._queues.setdefault(urlsplit(url).netloc, deque()).append((url, depth))
+
+    def pop_ready(self):
+        now = time.monotonic()
+        with self._lock:
+            for domain, queue in self._queues.items():
+                if not queue:
+                    continue
+                if self._in_flight.get(domain, 0) >= self.per_domain:
+                    continue
+                if self._next_allowed.get(domain, 0) > now:
+                    continue
+                self._in_flight[domain] = self._in_flight.get(domain, 0) + 1
+                # rotate the domain to the back so busy hosts don't starve the rest
+                self._queues[domain] = self._queues.pop(domain)
+                return queue.popleft()
+        return None
+
+    def release(self, url):
+        domain = urlsplit(url).netloc
+        with self._lock:
+            self._in_flight[domain] = max(self._in_flight.get(domain, 0) - 1, 0)
+            self._next_allowed[domain] = time.monotonic() + self.delay
+
+    def next_wait(self):
+        now = time.monotonic()
+        with self._lock:
+            waits = [max(self._next_allowed.get(d, 0) - now, 0) for d, q in self._queues.items() if q]
+        if not waits:
+            return 0.25
+        return min(max(min(waits), 0.05), 0.25)
+
+    def has_pending(self):
+        with self._lock:
+            return any(self._queues.values())
+
+    def pending(self):
+        with self._lock:
+            return [item for q in self._queues.values() for item in q]
+
+    def pending_count(self):
+        with self._lock:
+            return sum(len(q) for q in self._queues.values())
+
+    def seen(self):
+        with self._lock:
+            return list(self._seen)
+
+class ExportWriter:
+
+    key = ""
+    name = ""
+    extension = ""
+
+    def load(self):
+        return True
+
+    def outputs(self, base):
+        return [base + self.extension]
+
+    def write(self, path, paper):
+        raise NotImplementedError
+
+class DocxWriter(ExportWriter):
+
+    key = "docx"
+    name = "Word Document"
+    extension = ".docx"
+
+    def load(self):
+        self.Document, self.Pt, self.Inches = _ensure_docx()
+        return self.Document is not None
+
+    def write(self, path, paper):
+        doc = self.Document()
+        style = doc.styles['Normal']
+        style.font.name = 'Calibri'
+        style.font.size = self.Pt(11)
+
+        for q in paper["questions"]:
+            doc.add_paragraph(f"Q{q['number']}. {q['text']}")
+            for img in q["images"]:
+                try:
+                    doc.add_picture(io.BytesIO(img["data"]), width=self.Inches(4.5))
+                except Exception:
+                    continue
+            doc.add_paragraph("")
+
+        doc.save(path)
+
+class PdfWriter(ExportWriter):
+
+    key = "pdf"
+    name = "PDF"
+    extension = ".pdf"
+
+    FONT = "Helvetica"
+    UNICODE_FONT = "QPUnicode"
+    UNICODE_FONT_FILES = (
+        "DejaVuSans.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/dejavu/DejaVuSans.ttf",
+        "/Library/Fonts/Arial Unicode.ttf",
+        "C:\\Windows\\Fonts\\arialuni.ttf",
+        "C:\\Windows\\Fonts\\seguisym.ttf",
+        "C:\\Windows\\Fonts\\arial.ttf",
+    )
+    FONT_SIZE = 11
+    LEADING = 15
+    MARGIN = 54
+    OPTION_INDENT = 18
+    IMAGE_MAX_WIDTH = 4.5 * 72
+    IMAGE_MAX_HEIGHT = 4.0 * 72
+
+    def load(self):
+        self.canvas, self.pagesize, self.ImageReader, self.simpleSplit = _ensure_reportlab()
+        if self.canvas is None:
+            return False
+        self.font = self._register_unicode_font()
+        return True
+
+    def _register_unicode_font(self):
+        # the built-in Type1 fonts only cover Latin-1, so prefer any Unicode TTF we can find
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+
+        if self.UNICODE_FONT in pdfmetrics.getRegisteredFontNames():
+            return self.UNICODE_FONT
+        for font_file in self.UNICODE_FONT_FILES:
+            try:
+                pdfmetrics.registerFont(TTFont(self.UNICODE_FONT, font_file))
+                return self.UNICODE_FONT
+            except Exception:
+                continue
+        return self.FONT
+
+    def write(self, path, paper):
+        c = self.canvas.Canvas(path, pagesize=self.pagesize)
+        c.setTitle(paper["title"])
+        page_w, page_h = self.pagesize
+        text_w = page_w - 2 * self.MARGIN
+        y = page_h - self.MARGIN
+
+        def ensure_space(h):
+            nonlocal y
+            if y - h < self.MARGIN:
+                c.showPage()
+                y = page_h - self.MARGIN
+
+        def draw_lines(text, indent):
+            nonlocal y
+            for line in self.simpleSplit(text, self.font, self.FONT_SIZE, text_w - indent) or [""]:
+                ensure_space(self.LEADING)
+                c.setFont(self.font, self.FONT_SIZE)
+                c.drawString(self.MARGIN + indent, y - self.FONT_SIZE, line)
+                y -= self.LEADING
+
+        for q in paper["questions"]:
+            draw_lines(f"Q{q['number']}. {q['stem']}", 0)
+            for opt in q["options"]:
+                draw_lines(opt, self.OPTION_INDENT)
+
+            for img in q["images"]:
+                scale = min(self.IMAGE_MAX_WIDTH / img["width"], self.IMAGE_MAX_HEIGHT / img["height"], 1.0)
+                w, h = img["width"] * scale, img["height"] * scale
+                ensure_space(h + 6)
+                try:
+                    c.drawImage(self.ImageReader(io.BytesIO(img["data"])), self.MARGIN, y - h - 6, width=w, height=h, mask="auto")
+                except Exception:
+                    continue
+                y -= h + 12
+
+            y -= self.LEADING
+
+        c.save()
+
+class HtmlWriter(ExportWriter):
+
+    key = "html"
+    name = "HTML"
+    extension = ".html"
+
+    def write(self, path, paper):
+        esc = html_lib.escape
+        parts = [
+            "<!DOCTYPE html>",
+            "<html><head><meta charset=\"utf-8\">",
+            f"<title>{esc(paper['title'])}</title>",
+            "<style>body{font-family:Calibri,Arial,sans-serif;font-size:11pt;max-width:820px;margin:2em auto;}"
+            ".q{margin-bottom:1.4em;}.opt{margin-left:1.5em;}img{max-width:4.5in;display:block;margin:.5em 0;}</style>",
+            "</head><body>",
+        ]
+        for q in paper["questions"]:
+            parts.append("<div class=\"q\">")
+            parts.append(f"<p><b>Q{q['number']}.</b> {esc(q['stem'])}</p>")
+            for opt in q["options"]:
+                parts.append(f"<div class=\"opt\">{esc(opt)}</div>")
+            for img in q["images"]:
+                mime = "image/jpeg" if img["format"] == "JPEG" else "image/png"
+                data = base64.b64encode(img["data"]).decode("ascii")
+                parts.append(f"<img src=\"data:{mime};base64,{data}\" width=\"{img['width']}\" alt=\"\">")
+            parts.append("</div>")
+        parts.append("</body></html>")
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(parts))
+
+class MarkdownWriter(ExportWriter):
+
+    key = "md"
+    name = "Markdown"
+    extension = ".md"
+
+    IMAGE_NAME_RE = re.compile(r"^q\d+_\d+\.(?:png|jpg)$")
+
+    def outputs(self, base):
+        return [base + self.extension, base + "_images"]
+
+    def _escape(self, text):
+        text = re.sub(r"([\\`*_\[\]<>#|~])", r"\\\1", text)
+        # a leading "1." or "+"/"-" would otherwise start a list
+        return re.sub(r"^(\s*)(\d+)([.)])", r"\1\2\\\3", re.sub(r"^(\s*)([+\-])", r"\1\\\2", text))
+
+    def _clear_old_images(self, img_dir):
+        if not os.path.isdir(img_dir):
+            return
+        for name in os.listdir(img_dir):
+            if self.IMAGE_NAME_RE.match(name):
+                try:
+                    os.remove(os.path.join(img_dir, name))
+                except OSError:
+                    pass
+
+    def write(self, path, paper):
+        base = os.path.splitext(path)[0]
+        img_dir = base + "_images"
+        self._clear_old_images(img_dir)
+        lines = [f"# {self._escape(paper['title'])}", ""]
+
+        for q in paper["questions"]:
+            lines.append(f"**Q{q['number']}.** {self._escape(q['stem'])}")
+            lines.append("")
+            for opt in q["options"]:
+                opt = re.sub(r"^\s*[•\-\u2013\u2014]\s+", "", opt)
+                lines.append(f"- {self._escape(opt)}")
+            if q["options"]:
+                lines.append("")
+            for n, img in enumerate(q["images"], start=1):
+                os.makedirs(img_dir, exist_ok=True)
+                name = f"q{q['number']}_{n}.{'jpg' if img['format'] == 'JPEG' else 'png'}"
+                with open(os.path.join(img_dir, name), "wb") as f:
+                    f.write(img["data"])
+                lines.append(f"![Q{q['number']} diagram {n}](<{os.path.basename(img_dir)}/{name}>)")
+                lines.append("")
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+
+class JsonWriter(ExportWriter):
+
+    key = "json"
+    name = "JSON"
+    extension = ".json"
+
+    def write(self, path, paper):
+        out = {
+            "title": paper["title"],
+            "created": paper["created"],
+            "count": len(paper["questions"]),
+            "questions": [
+                {
+                    "number": q["number"],
+                    "text": q["text"],
+                    "stem": q["stem"],
+                    "options": q["options"],
+                    "images": [
+                        {"url": img["url"], "format": img["format"], "width": img["width"], "height": img["height"]}
+                        for img in q["images"]
+                    ],
+                }
+                for q in paper["questions"]
+            ],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(out, f, ensure_ascii=False, indent=2)
+
+EXPORT_WRITERS = [DocxWriter, PdfWriter, HtmlWriter, MarkdownWriter, JsonWriter]
+
 class QuestionPaperApp(ctk.CTk):
 
     MAX_IMAGES_PER_QUESTION = 6
     OPTION_CAPTURE_WINDOW = 12
     OPTION_LABEL_STYLE = "a)"
+    MAX_URL_ENTRIES = 20
+
+    CRAWL_DEFAULT_MAX_PAGES = 200
+    CRAWL_DEFAULT_DEPTH = 3
+    CRAWL_DEFAULT_WORKERS = 3
+    CRAWL_DEFAULT_DELAY = 1.0
+    CRAWL_MAX_PAGES_LIMIT = 5000
+    CRAWL_PER_DOMAIN_LIMIT = 2
+    CRAWL_CHECKPOINT_EVERY = 25
+    CRAWL_CHECKPOINT_SECONDS = 30.0
+    PAGINATION_TEXTS = ("next", "next page", "next »", "»", "›", ">>", "older")
+    PAGINATION_WEAK_TEXTS = ("more", ">")
+    PAGINATION_CONTAINER_HINTS = ("pagination", "pager", "page-numbers", "paging")
+    TRACKING_PARAMS = ("fbclid", "gclid")
+
+    RETRY_MAX_ATTEMPTS = 3
+    RETRY_BACKOFF_BASE = 2.0
+    RETRY_BACKOFF_MAX = 30.0
+    CHECKPOINT_MAX_AGE = 7 * 24 * 3600
+    TRANSIENT_ERROR_NAMES = ("ConnectionError", "Timeout", "ConnectTimeout", "ReadTimeout", "ChunkedEncodingError")
+    TRANSIENT_WEBDRIVER_PATTERNS = (
+        "ERR_CONNECTION_RESET", "ERR_CONNECTION_CLOSED", "ERR_TIMED_OUT",
+        "ERR_NETWORK_CHANGED", "ERR_EMPTY_RESPONSE", "timed out receiving message from renderer",
+    )
+
+    PREVIEW_MAX_WORKERS = 3
+    PREVIEW_THUMB_SIZE = (220, 160)
+    PREVIEW_PREFETCH_DEBOUNCE_MS = 150
+    PREVIEW_PREFETCH_MAX_PENDING = 4
+    PREVIEW_CACHE_SIZE = 200
+
+    EXPORT_TITLE = "Question Paper"
+    EXPORT_FETCH_WORKERS = 4
+    EXPORT_IMAGE_MAX_PX = 1200
 
     def __init__(self):
         super().__init__()
@@ -84,8 +478,20 @@ class QuestionPaperApp(ctk.CTk):
         self.url_entries = []
         self.all_questions = []
         self.current_disable_widget = None
-
-        self._preview_temp_files = []
+        self._crawl_config = None
+        self._driver_path = None
+        self._driver_lock = threading.Lock()
+        self._active_drivers = set()
+        self._closing = threading.Event()
+        self._back_to_inputs = self._show_start_screen
+
+        self._preview_temp_files = set()
+        self._preview_lock = threading.Lock()
+        self._preview_executor = ThreadPoolExecutor(max_workers=self.PREVIEW_MAX_WORKERS)
+        self._preview_futures = OrderedDict()
+        self._preview_failures = set()
+        self._preview_rows = []
+        self._prefetch_job = None
 
         self._show_start_screen()
 
@@ -119,7 +525,27 @@ class QuestionPaperApp(ctk.CTk):
             self.current_disable_widget = None
 
     def _on_app_close(self):
-        for p in self._preview_temp_files:
+        self._closing.set()
+        if self._prefetch_job is not None:
+            try:
+                self.after_cancel(self._prefetch_job)
+            except Exception:
+                pass
+        with self._preview_lock:
+            for fut in self._preview_futures.values():
+                fut.cancel()
+            leftovers = list(self._preview_temp_files)
+            self._preview_temp_files.clear()
+        self._preview_executor.shutdown(wait=False)
+        with self._driver_lock:
+            drivers = list(self._active_drivers)
+            self._active_drivers.clear()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        for p in leftovers:
             try:
                 os.remove(p)
             except Exception:
@@ -139,9 +565,12 @@ class QuestionPaperApp(ctk.CTk):
         self.count_entry.pack(pady=(0, 15))
 
         btn = ctk.CTkButton(frame, text="➡️ Next", command=self._go_to_url_inputs)
-        btn.pack(pady=(0, 20))
+        btn.pack(pady=(0, 10))
+
+        crawl_btn = ctk.CTkButton(frame, text="🕸️ Crawl Mode (paginated sites / sitemaps)", command=self._show_crawl_screen)
+        crawl_btn.pack(pady=(0, 20))
 
-        tip = ctk.CTkLabel(frame, text="Paste multiple URLs, merge & dedupe questions, and export to one DOCX.\nDiagrams/photos near questions will be included.", justify="center")
+        tip = ctk.CTkLabel(frame, text="Paste multiple URLs, merge & dedupe questions, and export to one DOCX.\nDiagrams/photos near questions will be included.\nFor hundreds of pages, use Crawl Mode to follow pagination or a sitemap.", justify="center")
         tip.pack()
 
     def _go_to_url_inputs(self):
@@ -150,8 +579,12 @@ class QuestionPaperApp(ctk.CTk):
             messagebox.showerror("Invalid input", "Please enter a valid positive number.")
             return
         count = int(raw)
-        if count <= 0 or count > 20:
-            messagebox.showerror("Invalid input", "Please enter a number between 1 and 20.")
+        if count <= 0:
+            messagebox.showerror("Invalid input", "Please enter a valid positive number.")
+            return
+
+        if count > self.MAX_URL_ENTRIES:
+            self._show_crawl_screen(bulk=True)
             return
 
         self._show_url_input_screen(count)
@@ -159,6 +592,7 @@ class QuestionPaperApp(ctk.CTk):
     def _show_url_input_screen(self, count):
         self._clear_container()
         self.url_entries.clear()
+        self._back_to_inputs = lambda c=count: self._show_url_input_screen(c)
 
         frame = ctk.CTkFrame(self.container)
         frame.pack(fill="both", expand=True, padx=10, pady=10)
@@ -186,6 +620,73 @@ class QuestionPaperApp(ctk.CTk):
         tip = ctk.CTkLabel(frame, text="Notes:\n- All questions across these URLs will be merged and deduplicated.\n- Select the questions you want and export to one DOCX file.\n- Diagrams/photos located near questions will be attached.", justify="left")
         tip.pack(pady=(6, 10), anchor="w", padx=4)
 
+    def _show_crawl_screen(self, bulk=False):
+        self._clear_container()
+        self._back_to_inputs = self._show_crawl_screen
+
+        cfg = self._crawl_config or {}
+        defaults = {
+            "sitemap": cfg.get("sitemap", ""),
+            "pattern": cfg.get("pattern", ""),
+            "max_pages": str(cfg.get("max_pages", self.CRAWL_DEFAULT_MAX_PAGES)),
+            "max_depth": "0" if bulk else str(cfg.get("max_depth", self.CRAWL_DEFAULT_DEPTH)),
+            "workers": str(cfg.get("workers", self.CRAWL_DEFAULT_WORKERS)),
+            "per_domain": str(cfg.get("per_domain", self.CRAWL_PER_DOMAIN_LIMIT)),
+            "delay": str(cfg.get("delay", self.CRAWL_DEFAULT_DELAY)),
+        }
+
+        frame = ctk.CTkFrame(self.container)
+        frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        header_text = "Paste your website URLs (one per line)" if bulk else "Crawl Mode"
+        header = ctk.CTkLabel(frame, text=header_text, font=ctk.CTkFont(size=18, weight="bold"))
+        header.pack(pady=(10, 5))
+
+        ctk.CTkLabel(frame, text="Seed URLs (one per line):", anchor="w").pack(fill="x", padx=14)
+        self.crawl_seeds_box = ctk.CTkTextbox(frame, width=860, height=160)
+        self.crawl_seeds_box.pack(pady=(4, 10), padx=10, fill="x")
+        if cfg.get("seeds"):
+            self.crawl_seeds_box.insert("1.0", "\n".join(cfg["seeds"]))
+
+        form = ctk.CTkFrame(frame)
+        form.pack(fill="x", padx=10, pady=(0, 10))
+        form.grid_columnconfigure(1, weight=1)
+        form.grid_columnconfigure(3, weight=1)
+
+        fields = [
+            ("sitemap", "Sitemap URL (optional):", "https://example.com/sitemap.xml", 0, 0, 3),
+            ("pattern", "Follow links matching (regex, optional):", r"e.g. /questions/|[?&]page=\d+", 1, 0, 3),
+            ("max_pages", "Max pages:", "", 2, 0, 1),
+            ("max_depth", "Max regex link depth:", "", 2, 2, 1),
+            ("workers", "Concurrent pages (total):", "", 3, 0, 1),
+            ("per_domain", "Concurrent pages per domain:", "", 3, 2, 1),
+            ("delay", "Delay per domain (s):", "", 4, 0, 1),
+        ]
+        self.crawl_entries = {}
+        for key, label, placeholder, r, c, span in fields:
+            ctk.CTkLabel(form, text=label, anchor="w").grid(row=r, column=c, padx=(8, 6), pady=5, sticky="w")
+            entry = ctk.CTkEntry(form, placeholder_text=placeholder)
+            entry.grid(row=r, column=c + 1, columnspan=span, padx=(0, 8), pady=5, sticky="ew")
+            if defaults[key]:
+                entry.insert(0, defaults[key])
+            self.crawl_entries[key] = entry
+
+        self.crawl_pagination_var = ctk.BooleanVar(value=False if bulk else cfg.get("follow_pagination", True))
+        ctk.CTkCheckBox(form, text="Follow pagination links", variable=self.crawl_pagination_var).grid(
+            row=4, column=2, columnspan=2, padx=(8, 8), pady=5, sticky="w")
+
+        button_row = ctk.CTkFrame(frame)
+        button_row.pack(pady=(4, 6))
+
+        back_btn = ctk.CTkButton(button_row, text="⬅️ Back", width=140, command=self._show_start_screen)
+        back_btn.pack(side="left", padx=10)
+
+        self.crawl_button = ctk.CTkButton(button_row, text="🕸️ Start Crawl", width=180, command=self.start_crawl_async)
+        self.crawl_button.pack(side="left", padx=10)
+
+        tip = ctk.CTkLabel(frame, text="Notes:\n- Pagination links (rel=next, \"Next\", page numbers) are followed until the max pages is reached.\n- Links matching the regex are followed up to the max regex link depth.\n- Untick pagination and leave depth at 0 to load only the listed URLs.\n- Each site gets at most the per-domain number of pages at once, whatever the total.\n- Every sitemap entry is loaded (up to the max pages); the regex only applies to links found on pages.\n- Progress is saved periodically, so an interrupted crawl can be resumed.", justify="left")
+        tip.pack(pady=(6, 10), anchor="w", padx=4)
+
     def _show_results_screen(self):
         self._clear_container()
 
@@ -209,11 +710,21 @@ class QuestionPaperApp(ctk.CTk):
 
         self.scroll_frame = ctk.CTkScrollableFrame(frame, width=880, height=460)
         self.scroll_frame.pack(pady=12, fill="both", expand=True)
-
-        self.export_button = ctk.CTkButton(frame, text="📤 Export Selected Questions to DOCX (with diagrams)", command=self.export_to_docx)
+        self._preview_rows = []
+
+        formats_row = ctk.CTkFrame(frame)
+        formats_row.pack(pady=(0, 4))
+        ctk.CTkLabel(formats_row, text="Export as:").pack(side="left", padx=(8, 6))
+        self.export_format_vars = {}
+        for writer_cls in EXPORT_WRITERS:
+            var = ctk.BooleanVar(value=writer_cls.key == "docx")
+            ctk.CTkCheckBox(formats_row, text=writer_cls.name, variable=var).pack(side="left", padx=6)
+            self.export_format_vars[writer_cls.key] = var
+
+        self.export_button = ctk.CTkButton(frame, text="📤 Export Selected Questions (with diagrams)", command=self.export_selected)
         self.export_button.pack(pady=10)
 
-        back_btn = ctk.CTkButton(frame, text="⬅️ Back to URLs", command=lambda: self._show_url_input_screen(len(self.url_entries)))
+        back_btn = ctk.CTkButton(frame, text="⬅️ Back to URLs", command=self._back_to_inputs)
         back_btn.pack(pady=(0, 10))
 
     def load_questions_async_multi(self):
@@ -235,39 +746,444 @@ class QuestionPaperApp(ctk.CTk):
             messagebox.showerror("❌ Invalid URLs", "Please ensure all URLs start with http or https.")
             return
 
+        self._prune_checkpoints()
+        restorable = [u for u in urls if self._load_checkpoint(u) is not None]
+        reuse = bool(restorable) and messagebox.askyesno(
+            "Resume loading?",
+            f"{len(restorable)} of {len(urls)} URL(s) were already loaded in a previous run.\n\nReuse them and only load the rest?"
+        )
+
         self._set_status(f"Starting to load {len(urls)} site(s)...")
         self._start_loader(disable_widget=self.load_all_button)
-        threading.Thread(target=self._load_questions_worker_multi, args=(urls,), daemon=True).start()
+        threading.Thread(target=self._load_questions_worker_multi, args=(urls, reuse), daemon=True).start()
 
-    def _load_questions_worker_multi(self, urls):
+    def _load_questions_worker_multi(self, urls, reuse=False):
         aggregated = []
         seen_map = {}
         errors = []
 
         for idx, url in enumerate(urls, start=1):
+            if self._closing.is_set():
+                return
             try:
-                self.after(0, self._set_status, f"Loading {idx}/{len(urls)}: {url}")
-                html = self._scrape_page(url)
-                qdatas = self._extract_questions(html, url)
-                for qd in qdatas:
-                    key = (qd.get("key") or qd["text"]).lower()
-                    if key in seen_map:
-                        i = seen_map[key]
-                        existing = set(aggregated[i]["images"])
-                        for u in qd["images"]:
-                            if u not in existing and len(aggregated[i]["images"]) < self.MAX_IMAGES_PER_QUESTION:
-                                aggregated[i]["images"].append(u)
-                                existing.add(u)
-                    else:
-                        seen_map[key] = len(aggregated)
-                        qd["images"] = qd["images"][: self.MAX_IMAGES_PER_QUESTION]
-                        aggregated.append(qd)
+                saved = self._load_checkpoint(url) if reuse else None
+                if saved is not None:
+                    self.after(0, self._set_status, f"Restored {idx}/{len(urls)} from checkpoint: {url}")
+                    qdatas = self._copy_questions(saved)
+                else:
+                    self.after(0, self._set_status, f"Loading {idx}/{len(urls)}: {url}")
+                    html = self._scrape_page_with_retries(url)
+                    qdatas = self._extract_questions(html, url)
+                    self._save_checkpoint(url, self._copy_questions(qdatas))
+                self._merge_questions(aggregated, seen_map, qdatas)
             except Exception as e:
                 err = f"{e.__class__.__name__}: {e}\n{traceback.format_exc()}"
                 errors.append((url, err))
 
+        if not errors:
+            for url in urls:
+                self._drop_checkpoint(url)
+
         self.after(0, self._on_questions_loaded_multi, aggregated, errors)
 
+    def _checkpoint_path(self, url):
+        try:
+            key = self._normalize_url(url)
+        except ValueError:
+            key = url.strip()
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(_app_cache_dir("checkpoints"), f"{digest}.json")
+
+    def _load_checkpoint(self, url):
+        try:
+            data = _load_json(self._checkpoint_path(url))
+        except OSError:
+            return None
+        if not data or time.time() - data.get("saved_at", 0) > self.CHECKPOINT_MAX_AGE:
+            return None
+        return data.get("questions")
+
+    def _save_checkpoint(self, url, qdatas):
+        try:
+            _save_json_atomic(self._checkpoint_path(url), {"url": url, "saved_at": time.time(), "questions": qdatas})
+        except Exception as e:
+            print("Checkpoint issue:", e)
+
+    def _drop_checkpoint(self, url):
+        try:
+            os.remove(self._checkpoint_path(url))
+        except Exception:
+            pass
+
+    def _prune_checkpoints(self):
+        try:
+            folder = _app_cache_dir("checkpoints")
+            now = time.time()
+            for name in os.listdir(folder):
+                path = os.path.join(folder, name)
+                if now - os.path.getmtime(path) > self.CHECKPOINT_MAX_AGE:
+                    os.remove(path)
+        except Exception:
+            pass
+
+    def _copy_questions(self, qdatas):
+        return [dict(qd, images=list(qd.get("images", []))) for qd in qdatas]
+
+    def _is_transient_error(self, exc):
+        if isinstance(exc, SessionNotCreatedException):
+            return False
+        if isinstance(exc, (TransientHTTPError, TimeoutException, TimeoutError, ConnectionError)):
+            return True
+        if isinstance(exc, WebDriverException):
+            msg = str(exc).lower()
+            return any(p.lower() in msg for p in self.TRANSIENT_WEBDRIVER_PATTERNS)
+        return exc.__class__.__name__ in self.TRANSIENT_ERROR_NAMES
+
+    def _with_retries(self, fn, *args, label=""):
+        attempt = 1
+        while True:
+            try:
+                return fn(*args)
+            except Exception as e:
+                if attempt >= self.RETRY_MAX_ATTEMPTS or not self._is_transient_error(e):
+                    raise
+                delay = min(self.RETRY_BACKOFF_BASE * (2 ** (attempt - 1)), self.RETRY_BACKOFF_MAX)
+                delay += random.uniform(0, 0.5)
+                attempt += 1
+                if self._closing.is_set():
+                    raise
+                self.after(0, self._set_status, f"{e.__class__.__name__} on {label}; retrying in {delay:.0f}s (attempt {attempt}/{self.RETRY_MAX_ATTEMPTS})")
+                if self._closing.wait(delay):
+                    raise
+
+    def _scrape_page_with_retries(self, url, driver_path=None):
+        return self._with_retries(self._scrape_page, url, driver_path, label=url)
+
+    def _chromedriver_path(self):
+        with self._driver_lock:
+            if self._driver_path is None:
+                self._driver_path = ChromeDriverManager().install()
+            return self._driver_path
+
+    def _http_get(self, requests, url, timeout=15):
+        r = requests.get(url, timeout=timeout)
+        if r.status_code == 429 or r.status_code >= 500:
+            raise TransientHTTPError(f"HTTP {r.status_code} for {url}")
+        return r
+
+    def _merge_questions(self, aggregated, seen_map, qdatas):
+        for qd in qdatas:
+            key = (qd.get("key") or qd["text"]).lower()
+            if key in seen_map:
+                i = seen_map[key]
+                existing = set(aggregated[i]["images"])
+                for u in qd["images"]:
+                    if u not in existing and len(aggregated[i]["images"]) < self.MAX_IMAGES_PER_QUESTION:
+                        aggregated[i]["images"].append(u)
+                        existing.add(u)
+            else:
+                seen_map[key] = len(aggregated)
+                qd["images"] = qd["images"][: self.MAX_IMAGES_PER_QUESTION]
+                aggregated.append(qd)
+
+    def start_crawl_async(self):
+        self.checkbox_vars.clear()
+        self.checkboxes.clear()
+
+        raw_seeds = self.crawl_seeds_box.get("1.0", "end").splitlines()
+        seeds = [u.strip() for u in raw_seeds if u.strip()]
+        values = {k: (e.get() or "").strip() for k, e in self.crawl_entries.items()}
+        sitemap = values["sitemap"]
+
+        if not seeds and not sitemap:
+            messagebox.showerror("❌ No URLs", "Please enter at least one seed URL or a sitemap URL.")
+            return
+
+        if any(not u.startswith("http") for u in seeds + ([sitemap] if sitemap else [])):
+            messagebox.showerror("❌ Invalid URLs", "Please ensure all URLs start with http or https.")
+            return
+
+        if values["pattern"]:
+            try:
+                re.compile(values["pattern"])
+            except re.error as e:
+                messagebox.showerror("Invalid input", f"The link pattern is not a valid regular expression:\n\n{e}")
+                return
+
+        try:
+            max_pages = int(values["max_pages"] or self.CRAWL_DEFAULT_MAX_PAGES)
+            max_depth = int(values["max_depth"] or 0)
+            workers = int(values["workers"] or self.CRAWL_DEFAULT_WORKERS)
+            per_domain = int(values["per_domain"] or self.CRAWL_PER_DOMAIN_LIMIT)
+            delay = float(values["delay"] or 0)
+        except ValueError:
+            messagebox.showerror("Invalid input", "Max pages, depth and concurrency must be whole numbers; delay must be a number.")
+            return
+
+        if (not (1 <= max_pages <= self.CRAWL_MAX_PAGES_LIMIT) or not (0 <= max_depth <= 10)
+                or not (1 <= workers <= 8) or not (1 <= per_domain <= workers) or delay < 0):
+            messagebox.showerror("Invalid input", f"Please use 1-{self.CRAWL_MAX_PAGES_LIMIT} pages, depth 0-10, 1-8 concurrent pages in total, 1 to that total per domain and a non-negative delay.")
+            return
+
+        requests = None
+        if sitemap:
+            requests = _ensure_requests()
+            if requests is None:
+                return
+
+        config = {
+            "seeds": seeds,
+            "sitemap": sitemap,
+            "pattern": values["pattern"],
+            "max_pages": max_pages,
+            "max_depth": max_depth,
+            "workers": workers,
+            "per_domain": per_domain,
+            "delay": delay,
+            "follow_pagination": bool(self.crawl_pagination_var.get()),
+        }
+        self._crawl_config = config
+
+        state_path = self._crawl_state_path(config)
+        state = _load_json(state_path)
+        if state and not messagebox.askyesno(
+            "Resume crawl?",
+            f"An unfinished crawl of these URLs was found ({state.get('processed', 0)} page(s) done, "
+            f"{len(state.get('pending', []))} queued, {len(state.get('questions', []))} question(s)).\n\nResume it?"
+        ):
+            state = None
+
+        self._set_status("Starting crawl...")
+        self._start_loader(disable_widget=self.crawl_button)
+        threading.Thread(target=self._crawl_worker, args=(config, state_path, state, requests), daemon=True).start()
+
+    def _crawl_state_path(self, config):
+        ident = {k: config[k] for k in ("seeds", "sitemap", "pattern", "max_depth", "follow_pagination")}
+        digest = hashlib.sha1(json.dumps(ident, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(tempfile.gettempdir(), f"qp_crawl_{digest}.json")
+
+    def _crawl_worker(self, config, state_path, state, requests):
+        aggregated = []
+        seen_map = {}
+        errors = []
+        processed = 0
+
+        max_pages = config["max_pages"]
+        max_depth = config["max_depth"]
+        workers = config["workers"]
+        pattern = re.compile(config["pattern"]) if config["pattern"] else None
+
+        follow_pagination = config.get("follow_pagination", True)
+        frontier = CrawlFrontier(delay=config["delay"], per_domain=config.get("per_domain", self.CRAWL_PER_DOMAIN_LIMIT))
+        allowed = set()
+        for u in config["seeds"] + ([config["sitemap"]] if config["sitemap"] else []):
+            try:
+                allowed.add(urlsplit(self._normalize_url(u)).netloc)
+            except ValueError:
+                continue
+
+        if state:
+            aggregated = state.get("questions", [])
+            for i, qd in enumerate(aggregated):
+                seen_map[(qd.get("key") or qd["text"]).lower()] = i
+            errors = [tuple(e) for e in state.get("errors", [])]
+            processed = state.get("processed", 0)
+            frontier.restore(state.get("seen", []), [tuple(p) for p in state.get("pending", [])])
+        else:
+            for u in config["seeds"]:
+                try:
+                    frontier.add(self._normalize_url(u), 0)
+                except ValueError as e:
+                    errors.append((u, f"{e.__class__.__name__}: {e}"))
+            if config["sitemap"]:
+                self.after(0, self._set_status, f"Reading sitemap: {config['sitemap']}")
+                for u in self._read_sitemap(config["sitemap"], requests, max_pages, errors):
+                    try:
+                        frontier.add(self._normalize_url(u), 0)
+                    except ValueError:
+                        continue
+
+        try:
+            driver_path = self._chromedriver_path()
+        except Exception as e:
+            errors.append(("ChromeDriver", f"{e.__class__.__name__}: {e}\n{traceback.format_exc()}"))
+            self.after(0, self._on_questions_loaded_multi, aggregated, errors)
+            return
+
+        in_flight = {}
+        last_saved = processed
+        last_saved_at = time.monotonic()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while in_flight or (frontier.has_pending() and processed < max_pages):
+                if self._closing.is_set():
+                    for fut in in_flight:
+                        fut.cancel()
+                    break
+
+                while len(in_flight) < workers and processed + len(in_flight) < max_pages:
+                    item = frontier.pop_ready()
+                    if item is None:
+                        break
+                    in_flight[pool.submit(self._scrape_page_with_retries, item[0], driver_path)] = item
+
+                if not in_flight:
+                    time.sleep(frontier.next_wait())
+                    continue
+
+                done, _ = wait(in_flight, timeout=frontier.next_wait(), return_when=FIRST_COMPLETED)
+                for fut in done:
+                    url, depth = in_flight.pop(fut)
+                    frontier.release(url)
+                    processed += 1
+                    try:
+                        html = fut.result()
+                        self._merge_questions(aggregated, seen_map, self._extract_questions(html, url))
+                        for link, is_next in self._discover_links(html, url, pattern):
+                            if urlsplit(link).netloc not in allowed:
+                                continue
+                            # pagination keeps the parent's depth so long listings are bounded only by max_pages
+                            if is_next and follow_pagination:
+                                frontier.add(link, depth)
+                            elif depth < max_depth and pattern is not None and pattern.search(link):
+                                frontier.add(link, depth + 1)
+                    except Exception as e:
+                        errors.append((url, f"{e.__class__.__name__}: {e}\n{traceback.format_exc()}"))
+
+                    self.after(0, self._set_status, f"Crawled {processed}/{max_pages} page(s) • {frontier.pending_count()} queued • {len(aggregated)} question(s)")
+
+                if done and (processed - last_saved >= self.CRAWL_CHECKPOINT_EVERY
+                             or time.monotonic() - last_saved_at >= self.CRAWL_CHECKPOINT_SECONDS):
+                    self._save_crawl_state(state_path, frontier, list(in_flight.values()), aggregated, errors, processed)
+                    last_saved = processed
+                    last_saved_at = time.monotonic()
+
+        if self._closing.is_set():
+            self._save_crawl_state(state_path, frontier, list(in_flight.values()), aggregated, errors, processed)
+            return
+
+        if frontier.has_pending():
+            self._save_crawl_state(state_path, frontier, [], aggregated, errors, processed)
+        else:
+            try:
+                os.remove(state_path)
+            except Exception:
+                pass
+
+        self.after(0, self._on_questions_loaded_multi, aggregated, errors)
+
+    def _save_crawl_state(self, state_path, frontier, in_flight, aggregated, errors, processed):
+        try:
+            _save_json_atomic(state_path, {
+                "processed": processed,
+                "seen": frontier.seen(),
+                "pending": list(in_flight) + frontier.pending(),
+                "questions": aggregated,
+                "errors": errors[-50:],
+            })
+        except Exception as e:
+            print("Crawl checkpoint issue:", e)
+
+    def _normalize_url(self, url):
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+        host = (parts.hostname or "").lower()
+        if ":" in host:
+            host = f"[{host}]"
+        port = parts.port
+        if port is None or (scheme, port) in (("http", 80), ("https", 443)):
+            netloc = host
+        else:
+            netloc = f"{host}:{port}"
+        path = re.sub(r"/{2,}", "/", parts.path) or "/"
+        query = urlencode(sorted(
+            (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+            if not k.lower().startswith("utm_") and k.lower() not in self.TRACKING_PARAMS
+        ))
+        return urlunsplit((scheme, netloc, path, query, ""))
+
+    def _discover_links(self, html, page_url, pattern=None):
+        soup = BeautifulSoup(html, "html.parser")
+        links = []
+        for a in soup.find_all(["a", "link"], href=True):
+            href = (a.get("href") or "").strip()
+            if not href or href.startswith(("#", "javascript:", "mailto:", "tel:")):
+                continue
+
+            rel = " ".join(a.get("rel") or []).lower()
+            text = a.get_text(" ", strip=True).lower()
+            label = (a.get("aria-label") or "").strip().lower()
+            if a.name == "link" and "next" not in rel:
+                continue
+
+            absolute = urljoin(page_url, href)
+            if not absolute.startswith("http"):
+                continue
+
+            is_next = (
+                "next" in rel
+                or text in self.PAGINATION_TEXTS
+                or label in self.PAGINATION_TEXTS
+                or "next page" in label
+            )
+            # page numbers and "more" links are only trusted inside a pager or on the same listing path
+            if not is_next and (text in self.PAGINATION_WEAK_TEXTS or re.fullmatch(r"\d{1,4}", text)):
+                is_next = (
+                    self._in_pagination_container(a)
+                    or urlsplit(absolute).path.rstrip("/") == urlsplit(page_url).path.rstrip("/")
+                )
+            if is_next or (pattern is not None and pattern.search(absolute)):
+                try:
+                    links.append((self._normalize_url(absolute), is_next))
+                except ValueError:
+                    continue
+        return links
+
+    def _in_pagination_container(self, tag):
+        for parent in tag.parents:
+            if parent.name in (None, "[document]", "body"):
+                break
+            if parent.name == "nav":
+                return True
+            classes = " ".join(parent.get("class") or []).lower()
+            if any(h in classes for h in self.PAGINATION_CONTAINER_HINTS):
+                return True
+        return False
+
+    def _read_sitemap(self, sitemap_url, requests, limit, errors):
+        urls = []
+        stack = [sitemap_url]
+        visited = set()
+        while stack and len(urls) < limit:
+            sm = stack.pop()
+            if sm in visited:
+                continue
+            visited.add(sm)
+
+            try:
+                r = self._with_retries(self._http_get, requests, sm, label=sm)
+                if r.status_code != 200:
+                    errors.append((sm, f"HTTP {r.status_code} while reading sitemap"))
+                    continue
+                content = r.content
+                if content[:2] == b"\x1f\x8b":
+                    content = gzip.decompress(content)
+            except Exception as e:
+                errors.append((sm, f"{e.__class__.__name__}: {e}\n{traceback.format_exc()}"))
+                continue
+
+            soup = BeautifulSoup(content, "html.parser")
+            if soup.find("sitemapindex"):
+                for node in soup.find_all("sitemap"):
+                    loc = node.find("loc")
+                    if loc and loc.get_text(strip=True):
+                        stack.append(loc.get_text(strip=True))
+            else:
+                for node in soup.find_all("url"):
+                    loc = node.find("loc")
+                    if loc and loc.get_text(strip=True):
+                        urls.append(loc.get_text(strip=True))
+        return urls[:limit]
+
     def _on_questions_loaded_multi(self, questions, errors):
         self._stop_loader()
 
@@ -297,6 +1213,8 @@ class QuestionPaperApp(ctk.CTk):
             self.found_label.configure(text=f"Found {len(self.all_questions)} question(s) • {total_imgs} diagram(s)")
 
         self._set_status("Ready")
+        self._watch_preview_scroll()
+        self._schedule_prefetch()
 
     def _add_question_row(self, parent, qdata):
         var = ctk.BooleanVar(value=False)
@@ -325,7 +1243,9 @@ class QuestionPaperApp(ctk.CTk):
         row._preview_loaded = False
         row._preview_visible = False
         row._thumb_refs = []
-        row._thumb_paths = []
+
+        if qdata.get("images"):
+            self._preview_rows.append((row, qdata))
 
         self.checkbox_vars.append(var)
         self.checkboxes.append(cb)
@@ -358,54 +1278,187 @@ class QuestionPaperApp(ctk.CTk):
         row._preview_frame.pack(fill="x", padx=26, pady=(4, 6))
         row._preview_visible = True
 
-        def worker():
-            thumbs = []
-            for url in qdata.get("images", [])[: self.MAX_IMAGES_PER_QUESTION]:
-                path, was_webp, conv_failed = self._download_image(url, requests, ImageLib)
-                if not path:
-                    continue
+        def on_ui(thumbs):
+            try:
+                if not row.winfo_exists():
+                    return
+            except Exception:
+                return
+            for child in row._preview_frame.winfo_children():
+                child.destroy()
+            row._thumb_refs = []
+
+            if not thumbs:
+                ctk.CTkLabel(row._preview_frame, text="No diagrams to preview.").pack(pady=8)
+            else:
+                grid = ctk.CTkFrame(row._preview_frame)
+                grid.pack(fill="x", padx=4, pady=4)
+                cols = 3
+                for i, img in enumerate(thumbs):
+                    r = i // cols
+                    c = i % cols
+                    ctk_img = ctk.CTkImage(light_image=img, size=img.size)
+                    lbl = ctk.CTkLabel(grid, image=ctk_img, text="")
+                    lbl.grid(row=r, column=c, padx=6, pady=6, sticky="w")
+                    row._thumb_refs.append(ctk_img)
+
+            row._preview_loaded = True
+
+        def on_done(fut):
+            if self._closing.is_set():
+                return
+            try:
+                thumbs = fut.result()
+            except Exception:
+                thumbs = []
+            self.after(0, on_ui, thumbs)
+
+        self._request_thumbnails(qdata, requests, ImageLib).add_done_callback(on_done)
+
+    def _preview_key(self, qdata):
+        return tuple(qdata.get("images", [])[: self.MAX_IMAGES_PER_QUESTION])
+
+    def _request_thumbnails(self, qdata, requests, ImageLib):
+        key = self._preview_key(qdata)
+        with self._preview_lock:
+            fut = self._preview_futures.get(key)
+            if fut is not None and not fut.cancelled():
+                self._preview_futures.move_to_end(key)
+                return fut
+            fut = self._preview_executor.submit(self._build_thumbnails, list(key), requests, ImageLib)
+            self._preview_futures[key] = fut
+            self._evict_previews()
+        fut.add_done_callback(lambda f, k=key: self._forget_failed_preview(k, f))
+        return fut
+
+    def _forget_failed_preview(self, key, fut):
+        # failed sets are dropped from the cache but remembered, so only a click retries them
+        failed = fut.cancelled() or fut.exception() is not None or not fut.result()
+        with self._preview_lock:
+            if failed:
+                if self._preview_futures.get(key) is fut:
+                    del self._preview_futures[key]
+                if not fut.cancelled():
+                    self._preview_failures.add(key)
+            else:
+                self._preview_failures.discard(key)
+
+    def _evict_previews(self):
+        excess = len(self._preview_futures) - self.PREVIEW_CACHE_SIZE
+        if excess <= 0:
+            return
+        for key in [k for k, f in self._preview_futures.items() if f.done()][:excess]:
+            del self._preview_futures[key]
+
+    def _build_thumbnails(self, urls, requests, ImageLib):
+        thumbs = []
+        for url in urls:
+            if self._closing.is_set():
+                break
+            path, was_webp, conv_failed = self._download_image(url, requests, ImageLib)
+            if not path:
+                continue
+            with self._preview_lock:
+                self._preview_temp_files.add(path)
+            try:
+                with ImageLib.open(path) as im:
+                    img = im.convert("RGB") if im.mode not in ("RGB", "L") else im.copy()
+                img.thumbnail(self.PREVIEW_THUMB_SIZE)
+                thumbs.append(img)
+            except Exception:
+                pass
+            finally:
+                with self._preview_lock:
+                    self._preview_temp_files.discard(path)
                 try:
-                    img = ImageLib.open(path)
-                    img = img.convert("RGB") if img.mode not in ("RGB", "L") else img
-                    max_w, max_h = 220, 160
-                    img.thumbnail((max_w, max_h))
-                    w, h = img.size
-                    ctk_img = ctk.CTkImage(light_image=img, size=(w, h))
-                    thumbs.append((ctk_img, path))
+                    os.remove(path)
                 except Exception:
-                    try:
-                        os.remove(path)
-                    except Exception:
-                        pass
-                    continue
+                    pass
+        return thumbs
 
-            def on_ui():
-                for child in row._preview_frame.winfo_children():
-                    child.destroy()
+    def _watch_preview_scroll(self):
+        try:
+            canvas = self.scroll_frame._parent_canvas
+            scroll_cmd = canvas.tk.splitlist(canvas.cget("yscrollcommand"))
+        except Exception:
+            return
 
-                if not thumbs:
-                    ctk.CTkLabel(row._preview_frame, text="No diagrams to preview.").pack(pady=8)
-                else:
-                    grid = ctk.CTkFrame(row._preview_frame)
-                    grid.pack(fill="x", padx=4, pady=4)
-                    cols = 3
-                    for i, (ctk_img, path) in enumerate(thumbs):
-                        r = i // cols
-                        c = i % cols
-                        lbl = ctk.CTkLabel(grid, image=ctk_img, text="")
-                        lbl.grid(row=r, column=c, padx=6, pady=6, sticky="w")
-                        row._thumb_refs.append(ctk_img)
-                        row._thumb_paths.append(path)
-                        self._preview_temp_files.append(path)
-
-                row._preview_loaded = True
-                row._preview_visible = True
-
-            self.after(0, on_ui)
-
-        threading.Thread(target=worker, daemon=True).start()
-
-    def _scrape_page(self, url):
+        def on_yscroll(first, last):
+            if scroll_cmd:
+                canvas.tk.call(*scroll_cmd, first, last)
+            self._schedule_prefetch()
+
+        canvas.configure(yscrollcommand=on_yscroll)
+        canvas.bind("<Configure>", lambda e: self._schedule_prefetch(), add="+")
+
+    def _schedule_prefetch(self):
+        if self._closing.is_set():
+            return
+        if self._prefetch_job is not None:
+            try:
+                self.after_cancel(self._prefetch_job)
+            except Exception:
+                pass
+        self._prefetch_job = self.after(self.PREVIEW_PREFETCH_DEBOUNCE_MS, self._prefetch_previews)
+
+    def _prefetch_previews(self):
+        self._prefetch_job = None
+        frame = getattr(self, "scroll_frame", None)
+        try:
+            if frame is None or not frame.winfo_exists() or not self._preview_rows:
+                return
+        except Exception:
+            return
+
+        requests = _ensure_requests(quiet=True)
+        ImageLib = _ensure_pillow(quiet=True)
+        if requests is None or ImageLib is None:
+            return
+
+        try:
+            top, bottom = frame._parent_canvas.yview()
+            total = max(frame.winfo_height(), 1)
+        except Exception:
+            top, bottom, total = 0.0, 1.0, 1
+
+        # look one viewport ahead (and a little behind) of what is visible
+        span = (bottom - top) * total
+        lo = top * total - span * 0.25
+        hi = bottom * total + span
+
+        # rows are packed top to bottom, so binary search for the first one in range
+        rows = self._preview_rows
+        first, last = 0, len(rows)
+        while first < last:
+            mid = (first + last) // 2
+            try:
+                y = rows[mid][0].winfo_y()
+            except Exception:
+                y = lo
+            if y < lo:
+                first = mid + 1
+            else:
+                last = mid
+
+        with self._preview_lock:
+            pending = sum(1 for f in self._preview_futures.values() if not f.done())
+
+        for row, qdata in rows[first:]:
+            if pending >= self.PREVIEW_PREFETCH_MAX_PENDING:
+                break
+            try:
+                if row.winfo_y() > hi:
+                    break
+            except Exception:
+                continue
+            with self._preview_lock:
+                key = self._preview_key(qdata)
+                known = key in self._preview_futures or key in self._preview_failures
+            if not known:
+                self._request_thumbnails(qdata, requests, ImageLib)
+                pending += 1
+
+    def _scrape_page(self, url, driver_path=None):
         options = Options()
         try:
             options.add_argument("--headless=new")
@@ -419,9 +1472,15 @@ class QuestionPaperApp(ctk.CTk):
         options.add_argument("--disable-extensions")
         options.page_load_strategy = "eager"
 
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+        if self._closing.is_set():
+            raise RuntimeError("Application is closing")
+        driver = webdriver.Chrome(service=Service(driver_path or self._chromedriver_path()), options=options)
+        with self._driver_lock:
+            self._active_drivers.add(driver)
 
         try:
+            if self._closing.is_set():
+                raise RuntimeError("Application is closing")
             try:
                 driver.execute_cdp_cmd("Network.enable", {})
                 driver.execute_cdp_cmd("Network.setBlockedURLs", {
@@ -433,9 +1492,13 @@ class QuestionPaperApp(ctk.CTk):
             driver.set_page_load_timeout(50)
             driver.get(url)
 
-            WebDriverWait(driver, 25).until(
-                lambda d: len(d.find_elements(By.CSS_SELECTOR, "p, li")) >= 3 or len(d.page_source) > 20000
-            )
+            try:
+                WebDriverWait(driver, 25).until(
+                    lambda d: len(d.find_elements(By.CSS_SELECTOR, "p, li")) >= 3 or len(d.page_source) > 20000
+                )
+            except TimeoutException:
+                # sparse pages never satisfy the wait; extract from what rendered instead of retrying
+                pass
 
             self._expand_all(driver)
             self._progressive_scroll(driver)
@@ -443,7 +1506,12 @@ class QuestionPaperApp(ctk.CTk):
 
             return driver.page_source
         finally:
-            driver.quit()
+            with self._driver_lock:
+                self._active_drivers.discard(driver)
+            try:
+                driver.quit()
+            except Exception:
+                pass
 
     def _progressive_scroll(self, driver, steps=12, pause=0.35):
         try:
@@ -692,8 +1760,14 @@ class QuestionPaperApp(ctk.CTk):
             var.set(False)
 
     def export_to_docx(self):
-        Document, Pt, Inches = _ensure_docx()
-        if Document is None:
+        self.export_selected(formats=["docx"])
+
+    def export_selected(self, formats=None):
+        if formats is None:
+            formats = [k for k, var in getattr(self, "export_format_vars", {}).items() if var.get()]
+        writers = [cls() for cls in EXPORT_WRITERS if cls.key in formats]
+        if not writers:
+            messagebox.showinfo("No Format", "Please select at least one export format.")
             return
 
         selected = []
@@ -705,37 +1779,135 @@ class QuestionPaperApp(ctk.CTk):
             messagebox.showinfo("No Selection", "Please select at least one question.")
             return
 
-        file = filedialog.asksaveasfilename(defaultextension=".docx", filetypes=[("Word Document", "*.docx")])
+        for w in writers:
+            if not w.load():
+                return
+
+        requests = None
+        ImageLib = None
+        if any(qd["images"] for qd in selected):
+            requests = _ensure_requests()
+            ImageLib = _ensure_pillow()
+            if requests is None or ImageLib is None:
+                return
+
+        first = writers[0]
+        file = filedialog.asksaveasfilename(
+            defaultextension=first.extension,
+            filetypes=[(w.name, f"*{w.extension}") for w in writers],
+        )
         if not file:
             return
+        base = os.path.splitext(file)[0]
+
+        # the save dialog only confirmed the picked file; ask about the other formats' outputs
+        picked = os.path.normcase(os.path.abspath(file))
+        clashes = [p for w in writers for p in w.outputs(base)
+                   if os.path.exists(p) and os.path.normcase(os.path.abspath(p)) != picked]
+        if clashes and not messagebox.askyesno(
+            "Overwrite files?",
+            "The following files already exist and will be replaced:\n\n" + "\n".join(clashes) + "\n\nContinue?"
+        ):
+            return
 
-        doc = Document()
-        style = doc.styles['Normal']
-        style.font.name = 'Calibri'
-        style.font.size = Pt(11)
+        self._set_status(f"Exporting {len(selected)} question(s)...")
+        self._start_loader(disable_widget=self.export_button)
+        threading.Thread(target=self._export_worker, args=(selected, writers, base, requests, ImageLib), daemon=True).start()
 
-        for i, qd in enumerate(selected, start=1):
-            doc.add_paragraph(f"Q{i}. {qd['text']}")
-            for url in qd["images"]:
-                try:
-                    requests = _ensure_requests()
-                    if requests is None:
-                        continue
-                    r = requests.get(url, timeout=10)
-                    if r.status_code != 200:
-                        continue
-                    fd, path = tempfile.mkstemp(suffix=os.path.splitext(url)[1])
-                    os.close(fd)
-                    with open(path, "wb") as f:
-                        f.write(r.content)
-                    doc.add_picture(path, width=Inches(4.5))
-                    os.remove(path)
-                except Exception:
-                    continue
-            doc.add_paragraph("")
+    def _export_worker(self, selected, writers, base, requests, ImageLib):
+        written = []
+        errors = []
+        try:
+            self.after(0, self._set_status, f"Fetching diagrams for {len(selected)} question(s)...")
+            paper = self._prepare_export(selected, requests, ImageLib)
+        except Exception as e:
+            errors.append((base, f"{e.__class__.__name__}: {e}"))
+            self.after(0, self._on_export_done, len(selected), written, errors)
+            return
+
+        for w in writers:
+            path = base + w.extension
+            try:
+                self.after(0, self._set_status, f"Writing {w.name}: {path}")
+                w.write(path, paper)
+                written.append(path)
+            except Exception as e:
+                errors.append((path, f"{e.__class__.__name__}: {e}"))
+
+        self.after(0, self._on_export_done, len(selected), written, errors)
+
+    def _on_export_done(self, count, written, errors):
+        self._stop_loader()
+        self._set_status("Ready")
+
+        if errors:
+            msg = "Some exports failed:\n\n"
+            for path, err in errors:
+                msg += f"- {path}\n  {err}\n"
+            messagebox.showwarning("⚠️ Export Errors", msg)
+
+        if written:
+            messagebox.showinfo("Success", f"Exported {count} questions to:\n\n" + "\n".join(written))
+
+    def _prepare_export(self, selected, requests, ImageLib):
+        urls = list(dict.fromkeys(u for qd in selected for u in qd["images"]))
+        fetched = {}
+        if urls and requests is not None and ImageLib is not None:
+            with ThreadPoolExecutor(max_workers=self.EXPORT_FETCH_WORKERS) as pool:
+                results = pool.map(lambda u: self._fetch_export_image(u, requests, ImageLib), urls)
+                fetched = dict(zip(urls, results))
 
-        doc.save(file)
-        messagebox.showinfo("Success", f"Exported {len(selected)} questions to {file}")
+        questions = []
+        for i, qd in enumerate(selected, start=1):
+            lines = [l.strip() for l in qd["text"].splitlines() if l.strip()]
+            questions.append({
+                "number": i,
+                "text": qd["text"],
+                "stem": lines[0] if lines else "",
+                "options": lines[1:],
+                "images": [fetched[u] for u in qd["images"] if fetched.get(u)],
+            })
+
+        return {
+            "title": self.EXPORT_TITLE,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "questions": questions,
+        }
+
+    def _fetch_export_image(self, url, requests, ImageLib):
+        path, was_webp, conv_failed = self._download_image(url, requests, ImageLib)
+        if not path:
+            return None
+        try:
+            with ImageLib.open(path) as im:
+                src_format = im.format
+                img = im.copy()
+            if img.mode in ("P", "LA", "PA") or "transparency" in img.info:
+                img = img.convert("RGBA")
+            if img.mode == "RGBA":
+                # flatten onto white so transparent diagrams don't turn black in any writer
+                bg = ImageLib.new("RGB", img.size, (255, 255, 255))
+                bg.paste(img, mask=img.getchannel("A"))
+                img = bg
+            elif img.mode not in ("RGB", "L"):
+                img = img.convert("RGB")
+            img.thumbnail((self.EXPORT_IMAGE_MAX_PX, self.EXPORT_IMAGE_MAX_PX))
+
+            fmt = "JPEG" if src_format == "JPEG" and img.mode in ("RGB", "L") else "PNG"
+            buf = io.BytesIO()
+            if fmt == "JPEG":
+                img.save(buf, fmt, quality=88)
+            else:
+                img.save(buf, fmt)
+            w, h = img.size
+            return {"url": url, "data": buf.getvalue(), "format": fmt, "width": w, "height": h}
+        except Exception:
+            return None
+        finally:
+            try:
+                os.remove(path)
+            except Exception:
+                pass
 
 if __name__ == "__main__":
     app = QuestionPaperApp()